@@ -1,7 +1,116 @@
-from playwright.sync_api import Page, Locator, expect
+import re
+import sys
+import time
+from playwright.sync_api import Page, Locator, expect, TimeoutError as PlaywrightTimeoutError
 from utils.logger import get_logger
+from utils import impact
+
+
+# Selector syntax only Playwright understands: engines (text=, xpath=, internal:...), chaining (>>) and its pseudo-classes
+_PLAYWRIGHT_ONLY_SELECTOR = re.compile(
+    r"^\s*(//|\.\.|[a-z_:-]+=)|>>|:(has-text|text|text-is|text-matches|visible|nth-match|"
+    r"left-of|right-of|above|below|near|light)\b", re.IGNORECASE)
+
+# Checks every expectation once inside the page, with the same rules as expect(): the selector must match exactly
+# one element, text is the whitespace-normalized textContent, visible means a non-empty box and visibility:visible.
+# Returns [index, reason] for every expectation that is not met.
+CHECK_EXPECTATIONS_JS = """
+expectations => {
+  const normalize = text => text.replace(/\\s+/g, ' ').trim();
+  const failures = [];
+  for (const {index, kind, selector, expected} of expectations) {
+    if (kind === 'url') {
+      if (location.href !== expected) failures.push([index, `actual URL: ${location.href}`]);
+      continue;
+    }
+    const elements = document.querySelectorAll(selector);
+    if (elements.length !== 1) {
+      failures.push([index, `locator resolved to ${elements.length} elements`]);
+      continue;
+    }
+    const element = elements[0];
+    if (kind === 'visible') {
+      const box = element.getBoundingClientRect();
+      if (!box.width || !box.height || getComputedStyle(element).visibility !== 'visible')
+        failures.push([index, 'element is not visible']);
+      continue;
+    }
+    const actual = normalize(element.textContent || '');
+    if (!actual.includes(normalize(expected))) failures.push([index, `actual text: '${actual}'`]);
+  }
+  return failures;
+}
+"""
+
+
+def _normalize_whitespace(text: str) -> str:
+    return " ".join(text.split())
+
+
+def _first_line(error: Exception) -> str:
+    return (str(error) or repr(error)).splitlines()[0]
+
+
+class Expectation:
+    """A single visibility, text or URL check that can be batched with BasePage.verify_all()."""
+
+    VISIBLE = "visible"
+    TEXT = "text"
+    URL = "url"
+
+    def __init__(self, kind: str, locator: Locator = None, expected: str = None, name: str = None):
+        self.kind = kind
+        self.locator = locator
+        self.expected = expected
+        self.name = name
+
+    @classmethod
+    def visible(cls, locator: Locator, name: str = None):
+        return cls(cls.VISIBLE, locator=locator, name=name)
+
+    @classmethod
+    def text(cls, locator: Locator, expected_text: str, name: str = None):
+        return cls(cls.TEXT, locator=locator, expected=expected_text, name=name)
+
+    @classmethod
+    def url(cls, url: str):
+        return cls(cls.URL, expected=url)
+
+    def css_selector(self, page: Page) -> str:
+        """The plain CSS selector of a main-frame locator, or None if the expectation cannot be checked in the page."""
+        if self.kind == self.URL:
+            return ""
+        # Locator has no public selector accessor
+        locator_impl = getattr(self.locator, "_impl_obj", None)
+        selector = getattr(locator_impl, "_selector", None)
+        if not isinstance(selector, str) or getattr(locator_impl, "_frame", None) is not page.main_frame._impl_obj:
+            return None
+        return None if _PLAYWRIGHT_ONLY_SELECTOR.search(selector) else selector
+
+    def check(self, page: Page) -> str:
+        """Checks the expectation once, without auto-waiting. Returns None when met, else the reason it is not."""
+        if self.kind == self.URL:
+            return None if page.url == self.expected else f"actual URL: {page.url}"
+
+        # Same strictness as expect(): the locator must resolve to exactly one element
+        count = self.locator.count()
+        if count != 1:
+            return f"locator resolved to {count} elements"
+        if self.kind == self.VISIBLE:
+            return None if self.locator.is_visible() else "element is not visible"
+
+        # Same whitespace normalization as expect().to_contain_text()
+        actual_text = _normalize_whitespace(self.locator.text_content() or "")
+        return None if _normalize_whitespace(self.expected) in actual_text else f"actual text: '{actual_text}'"
+
 
 class BasePage:
+
+    # Same polling intervals as Playwright's expect()
+    POLLING_INTERVALS_MS = [100, 250, 500, 1000]
+    DEFAULT_VERIFY_TIMEOUT_MS = 5000
+
+
     def __init__(self, page: Page):
         self._page = page
         self._logger = get_logger(type(self).__name__)
@@ -10,27 +119,38 @@ class BasePage:
         """Returns the custom name if provided, else the locator string."""
         return name if name else str(locator)
 
+    def __track_usage(self):
+        """Records the calling page-object method for test-impact selection (only with --record-impact)."""
+        if impact.is_recording():
+            # Frame 0 is this method, 1 is the BasePage action, 2 is the page-object method that called it
+            impact.record_page_object_usage(self, sys._getframe(2).f_code.co_name)
+
     def navigate_to(self, url: str):
+        self.__track_usage()
         self._logger.info(f"Navigating to: {url}")
         self._page.goto(url)
 
     def do_click(self, locator: Locator, name: str = None):
+        self.__track_usage()
         element_log_name = self.__get_name(locator, name)
         self._logger.info(f"Clicking: '{element_log_name}' element")
         locator.click()
 
     def do_fill(self, locator: Locator, text: str, name: str = None):
+        self.__track_usage()
         element_log_name = self.__get_name(locator, name)
         self._logger.info(f"Filling '{text}' into: '{element_log_name}' element")
         locator.fill(text)
 
     def do_press_sequentially(self, locator: Locator, text: str, delay: int = 0, name: str = None, is_secret = False):
+        self.__track_usage()
         element_log_name = self.__get_name(locator, name)
         text_to_log = "*" * len(text) if is_secret else text
         self._logger.info(f"Typing '{text_to_log}' into: '{element_log_name}' element")
         locator.press_sequentially(text, delay=delay)
 
     def verify_text_element(self, locator: Locator, expected_text: str, name: str = None):
+        self.__track_usage()
         element_log_name = self.__get_name(locator, name)
         self._logger.info(f"Verifying '{element_log_name}' element contains text: '{expected_text}'")
         try:
@@ -40,6 +160,7 @@ class BasePage:
             raise e
 
     def verify_element_is_visible(self, locator: Locator, name: str = None):
+        self.__track_usage()
         element_log_name = self.__get_name(locator, name)
         self._logger.info(f"Verifying '{element_log_name}' element is visible")
         try:
@@ -49,9 +170,96 @@ class BasePage:
             raise e
 
     def verify_url(self, url: str):
+        self.__track_usage()
         self._logger.info(f"Verifying page URL is: {url}")
         try:
             expect(self._page).to_have_url(url)
         except Exception as e:
             self._logger.error(f"URL verification failed! Expected '{url}'. Error: {e}")
             raise e
+
+    def verify_all(self, expectations: list, timeout: float = DEFAULT_VERIFY_TIMEOUT_MS):
+        """
+        Waits until all expectations hold at the same time, then reports every failure at once.
+
+        Expectations on plain CSS locators (and URL checks) are polled inside the page by one wait_for_function
+        call. Locators that use Playwright-only selectors (get_by_role, text=, >>, :has-text(), filters, frames)
+        cannot be resolved from page JS; if any are in the set, the whole set is polled from Python instead.
+        """
+        self.__track_usage()
+        for expectation in expectations:
+            self._logger.info(f"Verifying {self.__describe(expectation)}")
+
+        selectors = [expectation.css_selector(self._page) for expectation in expectations]
+        if all(selector is not None for selector in selectors):
+            failures = self.__wait_in_page(expectations, selectors, timeout)
+        else:
+            failures = self.__poll_from_python(expectations, selectors, timeout)
+
+        if failures:
+            for failure in failures:
+                self._logger.error(f"Verification failed: {failure}")
+            raise AssertionError(
+                f"{len(failures)} of {len(expectations)} expectations failed after {timeout}ms:\n"
+                + "\n".join(f"  - {failure}" for failure in failures)
+            )
+
+    def __wait_in_page(self, expectations: list, selectors: list, timeout: float) -> list:
+        """One protocol round trip when everything already holds; on timeout, one more to collect the failures."""
+        try:
+            self._page.wait_for_function(f"expectations => ({CHECK_EXPECTATIONS_JS})(expectations).length === 0",
+                                         arg=self.__in_page_args(expectations, selectors), timeout=timeout)
+            return []
+        except PlaywrightTimeoutError:
+            return self.__check_in_page(expectations, selectors)
+
+    def __poll_from_python(self, expectations: list, selectors: list, timeout: float) -> list:
+        # Every poll re-checks the whole set, so success means all expectations held at the same time
+        deadline = time.monotonic() + timeout / 1000
+        attempt = 0
+        while True:
+            failures = self.__check_in_page(expectations, selectors) + self.__check_all(
+                [expectation for expectation, selector in zip(expectations, selectors) if selector is None])
+            if not failures or time.monotonic() >= deadline:
+                return failures
+            interval = self.POLLING_INTERVALS_MS[min(attempt, len(self.POLLING_INTERVALS_MS) - 1)]
+            remaining_ms = (deadline - time.monotonic()) * 1000
+            self._page.wait_for_timeout(max(0, min(interval, remaining_ms)))
+            attempt += 1
+
+    @staticmethod
+    def __in_page_args(expectations: list, selectors: list) -> list:
+        return [{"index": index, "kind": expectation.kind, "selector": selector, "expected": expectation.expected}
+                for index, (expectation, selector) in enumerate(zip(expectations, selectors)) if selector is not None]
+
+    def __check_in_page(self, expectations: list, selectors: list) -> list:
+        """Checks the CSS expectations once with a single evaluate call."""
+        args = self.__in_page_args(expectations, selectors)
+        if not args:
+            return []
+        try:
+            results = self._page.evaluate(CHECK_EXPECTATIONS_JS, args)
+        except Exception as e:
+            # e.g. a navigation destroyed the execution context mid-check
+            results = [[arg["index"], _first_line(e)] for arg in args]
+        return [f"{self.__describe(expectations[index])} ({reason})" for index, reason in results]
+
+    def __check_all(self, expectations: list) -> list:
+        """Returns a description of every expectation that is not met right now."""
+        failures = []
+        for expectation in expectations:
+            try:
+                reason = expectation.check(self._page)
+            except Exception as e:
+                reason = _first_line(e)
+            if reason is not None:
+                failures.append(f"{self.__describe(expectation)} ({reason})")
+        return failures
+
+    def __describe(self, expectation: Expectation) -> str:
+        if expectation.kind == Expectation.URL:
+            return f"page URL is: {expectation.expected}"
+        element_log_name = self.__get_name(expectation.locator, expectation.name)
+        if expectation.kind == Expectation.VISIBLE:
+            return f"'{element_log_name}' element is visible"
+        return f"'{element_log_name}' element contains text: '{expectation.expected}'"
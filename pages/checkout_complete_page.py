@@ -1,5 +1,5 @@
 from playwright.sync_api import Page
-from pages.base_page import BasePage
+from pages.base_page import BasePage, Expectation
 
 class CheckoutCompletePage(BasePage):
 
@@ -22,6 +22,14 @@ class CheckoutCompletePage(BasePage):
     def validate_back_to_products_button_is_visible(self):
         self.verify_element_is_visible(self.__back_to_products_button, "Back Home Buttom")
 
+    def validate_order_completion(self, page_title: str, complete_text: str):
+        self.verify_all([
+            Expectation.visible(self.__complete_header, "Complete Header"),
+            Expectation.text(self.__page_title, page_title, "Page Title"),
+            Expectation.text(self.__complete_text, complete_text, "Complete Text"),
+            Expectation.visible(self.__back_to_products_button, "Back Home Buttom"),
+        ])
+
     def click_back_to_products_button(self):
         self.do_click(self.__back_to_products_button, "All Items Button")
 
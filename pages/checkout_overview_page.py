@@ -1,5 +1,5 @@
 from playwright.sync_api import Page
-from pages.base_page import BasePage
+from pages.base_page import BasePage, Expectation
 
 class CheckoutOverviewPage(BasePage):
 
@@ -23,6 +23,14 @@ class CheckoutOverviewPage(BasePage):
     def validate_total_info_label_is_visible(self):
         self.verify_element_is_visible(self.__total_info_label, "Total Info Label")
 
+    def validate_overview_details(self, page_title: str, shipping_text: str):
+        self.verify_all([
+            Expectation.text(self.__page_title, page_title, "Page Title"),
+            Expectation.visible(self.__payment_info_label, "Payment Info Label"),
+            Expectation.text(self.__shipping_info_label, shipping_text, "Shipping Info Label"),
+            Expectation.visible(self.__total_info_label, "Total Info Label"),
+        ])
+
     def click_finish_button(self):
         self.do_click(self.__finish_button, "Finish Button")
 
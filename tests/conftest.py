@@ -2,18 +2,160 @@ import pytest
 import allure
 from pathlib import Path
 from playwright.sync_api import Page
-from pages.login_page import LoginPage
-from pages.items_page import ItemsPage
-from pages.cart_page import CartPage
-from pages.checkout_info_page import CheckoutInfoPage
-from pages.checkout_overview_page import CheckoutOverviewPage
-from pages.checkout_complete_page import CheckoutCompletePage
-from pages.sidebar_menu import SidebarMenu
 from utils.logger import get_logger
+from utils import impact, data_loader
+from utils.prerequisites import PrerequisiteGate, BLOCKED_MESSAGE, write_allure_categories
+from utils.collection_cache import CollectionCache
+from utils.collection_profile import CollectionProfile
 
 # Initialize logger
 logger = get_logger(__name__)
 
+collection_cache_key = pytest.StashKey[CollectionCache]()
+collection_profile_key = pytest.StashKey[CollectionProfile]()
+prerequisite_gate_key = pytest.StashKey[PrerequisiteGate]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("impact", "test-impact selection")
+    group.addoption("--record-impact", action="store_true", default=False,
+                    help=f"Record which page objects and data files each test uses into {impact.IMPACT_MAP_FILE}")
+    group.addoption("--impacted-since", action="store", default=None, metavar="GIT_REF",
+                    help="Run only tests impacted by files changed since the given git ref")
+
+    group = parser.getgroup("prerequisites", "prerequisite gate")
+    group.addoption("--sanity-gate", action="store_true", default=False,
+                    help="Treat every sanity test as a prerequisite of all other tests")
+
+    group = parser.getgroup("browser-server", "warm browser server")
+    group.addoption("--connect-browser", action="store_true", default=False,
+                    help="Connect to the browser started by 'python -m utils.browser_server start' instead of launching one")
+    group.addoption("--browser-ws-endpoint", action="store", default=None, metavar="WS_ENDPOINT",
+                    help="Connect to a browser server at this websocket endpoint instead of launching one")
+
+    group = parser.getgroup("network", "network recording")
+    group.addoption("--record-network", action="store_true", default=False,
+                    help="Record a per-test network waterfall (JSONL) with per-step summaries in Allure")
+
+    group = parser.getgroup("matrix", "cross-browser matrix")
+    group.addoption("--matrix-manifest", action="store", default=None, metavar="PATH",
+                    help="Write the node ids each selected browser should run (used by 'python -m utils.matrix')")
+
+    group = parser.getgroup("collection", "collection performance")
+    group.addoption("--collect-profile", action="store_true", default=False,
+                    help="Report import time per module and collection time per test file")
+
+
+def pytest_configure(config):
+    impact.configure(config.rootpath, recording=config.getoption("--record-impact"))
+    config.stash[prerequisite_gate_key] = PrerequisiteGate(sanity_gate=config.getoption("--sanity-gate"))
+
+    cache = getattr(config, "cache", None)
+    if cache is not None:
+        data_loader.configure_cache(cache)
+        config.stash[collection_cache_key] = CollectionCache(config)
+
+    if config.getoption("--collect-profile"):
+        profile = CollectionProfile()
+        profile.start()
+        config.stash[collection_profile_key] = profile
+
+
+def pytest_ignore_collect(collection_path, config):
+    # Skip importing test files that cannot match -k, according to the cached item names
+    collection_cache = config.stash.get(collection_cache_key, None)
+    if collection_cache and collection_path.suffix == ".py" and collection_cache.can_skip(collection_path):
+        return True
+    return None
+
+
+def pytest_collectstart(collector):
+    # Data files loaded while a test module is imported belong to that module
+    if isinstance(collector, pytest.Module):
+        impact.start_module_collection(collector.path)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_make_collect_report(collector):
+    profile = collector.config.stash.get(collection_profile_key, None)
+    if profile is None or not isinstance(collector, pytest.Module):
+        yield
+        return
+    profile.start_file(collector.nodeid)
+    yield
+    profile.finish_file(collector.nodeid)
+
+
+def pytest_itemcollected(item):
+    collection_cache = item.config.stash.get(collection_cache_key, None)
+    if collection_cache:
+        collection_cache.add_item(item)
+
+
+def pytest_collection_finish(session):
+    collection_cache = session.config.stash.get(collection_cache_key, None)
+    if collection_cache:
+        collection_cache.save()
+    profile = session.config.stash.get(collection_profile_key, None)
+    if profile:
+        profile.stop()
+
+    manifest_path = session.config.getoption("--matrix-manifest")
+    if manifest_path:
+        from utils.matrix import write_manifest
+        write_manifest(session.config, session.items, manifest_path)
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    profile = config.stash.get(collection_profile_key, None)
+    if profile:
+        profile.write_report(terminalreporter)
+
+
+def pytest_collection_modifyitems(config, items):
+    select_impacted_items(config, items)
+    config.stash[prerequisite_gate_key].prioritize(items)
+
+
+def select_impacted_items(config, items):
+    git_ref = config.getoption("--impacted-since")
+    if not git_ref:
+        return
+    changed_files = impact.changed_files_since(git_ref)
+    selected, deselected = impact.select_impacted(items, changed_files)
+    logger.info(f"Impacted since '{git_ref}': {len(selected)} selected, {len(deselected)} deselected")
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    impact.start_test(item.nodeid)
+    yield
+    impact.finish_test()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    # Skip before any fixture (browser, page) is set up when a prerequisite already failed
+    blocked = item.config.stash[prerequisite_gate_key].blocked_by(item)
+    if blocked:
+        prerequisite, provider = blocked
+        allure.dynamic.tag("blocked")
+        pytest.skip(f"{BLOCKED_MESSAGE} '{prerequisite}' ({provider})")
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if impact.is_recording():
+        impact.save_impact_map(session.items)
+
+    # Written at the end, after allure-pytest has cleaned the results folder (--clean-alluredir)
+    config = session.config
+    allure_dir = config.getoption("allure_report_dir", None)
+    if allure_dir and not config.option.collectonly and not hasattr(config, "workerinput"):
+        write_allure_categories(allure_dir)
+
 
 # Configure viewport and video resolution for sharp recordings
 @pytest.fixture(scope="session")
@@ -25,12 +167,58 @@ def browser_context_args(browser_context_args):
     }
 
 
+# Connect to a warm browser server instead of launching a browser per pytest run
+@pytest.fixture(scope="session")
+def connect_options(pytestconfig, browser_name, browser_channel):
+    ws_endpoint = pytestconfig.getoption("--browser-ws-endpoint")
+    if not ws_endpoint and pytestconfig.getoption("--connect-browser"):
+        from utils.browser_server import get_ws_endpoint
+        # Channels are Chromium builds, like the matrix runner only passes --browser-channel to chromium
+        ws_endpoint = get_ws_endpoint(browser_name, browser_channel if browser_name == "chromium" else None)
+    if not ws_endpoint:
+        return None
+    logger.info(f"Connecting to browser server: {ws_endpoint}")
+    return {"ws_endpoint": ws_endpoint}
+
+
+# Browserless HTTP client for the api tier - one pooled request context per session
+@pytest.fixture(scope="session")
+def api_client():
+    from pages.login_page import LoginPage
+    from utils.api_client import ApiClient
+    client = ApiClient(LoginPage.BASE_URL)
+    client.start()
+    yield client
+    client.stop()
+
+
+# Opt-in network waterfall for every test that uses a page
+@pytest.fixture(autouse=True)
+def network_recorder(request):
+    if not request.config.getoption("--record-network") or "page" not in request.fixturenames:
+        yield None
+        return
+    from slugify import slugify
+    from utils.network_recorder import NetworkRecorder
+
+    page = request.getfixturevalue("page")
+    output_path = Path(request.config.getoption("--output")) / "network" / f"{slugify(request.node.nodeid)}.jsonl"
+    recorder = NetworkRecorder(output_path, request.node.name)
+    recorder.start(page.context)
+    yield recorder
+    recorder.stop()
+    recorder.attach_to_report()
+
+
 # Allure attachment hook - automatically attaches traces, videos, and screenshots after each test
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     outcome = yield
     report = outcome.get_result()
 
+    if report.when in ("setup", "call"):
+        item.config.stash[prerequisite_gate_key].record_result(item, report)
+
     # Store the test result in the item for later use
     if report.when == "call":
         item.test_failed = report.failed
@@ -73,7 +261,7 @@ def pytest_runtest_teardown(item):
     # Attach video from test-results directory (only for failed tests with retain-on-failure)
     if hasattr(item, "has_video") and hasattr(item, "test_failed") and item.test_failed:
         try:
-            test_results_dir = Path("test-results")
+            test_results_dir = Path(item.config.getoption("--output"))
             video_path = None
 
             if test_results_dir.exists():
@@ -110,7 +298,7 @@ def pytest_runtest_teardown(item):
     # Attach trace if available (only for failed tests with retain-on-failure)
     if "page" in item.funcargs and hasattr(item, "test_failed") and item.test_failed:
         try:
-            test_results_dir = Path("test-results")
+            test_results_dir = Path(item.config.getoption("--output"))
             trace_path = None
 
             if test_results_dir.exists():
@@ -138,32 +326,39 @@ def pytest_runtest_teardown(item):
         except Exception as e:
             logger.error(f"✗ Failed to attach trace: {e}")
 
-# Global Fixtures
+# Global Fixtures - page modules are imported lazily so collection does not pay for them
 @pytest.fixture
 def login_page(page: Page):
+    from pages.login_page import LoginPage
     logger.info("Global fixture: login_page")
     return LoginPage(page)
 
 @pytest.fixture
 def items_page(page: Page):
+    from pages.items_page import ItemsPage
     return ItemsPage(page)
 
 @pytest.fixture
 def cart_page(page: Page):
+    from pages.cart_page import CartPage
     return CartPage(page)
 
 @pytest.fixture
 def checkout_info_page(page: Page):
+    from pages.checkout_info_page import CheckoutInfoPage
     return CheckoutInfoPage(page)
 
 @pytest.fixture
 def checkout_overview_page(page: Page):
+    from pages.checkout_overview_page import CheckoutOverviewPage
     return CheckoutOverviewPage(page)
 
 @pytest.fixture
 def checkout_complete_page(page: Page):
+    from pages.checkout_complete_page import CheckoutCompletePage
     return CheckoutCompletePage(page)
 
 @pytest.fixture
 def sidebar_menu(page: Page):
+    from pages.sidebar_menu import SidebarMenu
     return SidebarMenu(page)
\ No newline at end of file
@@ -61,6 +61,7 @@ decorated with @allure.step for better code organization and reporting.
 """)
 @pytest.mark.regression
 @pytest.mark.checkout
+@pytest.mark.requires("login:standard_user")
 def test_order_with_helper_functions(login_page, items_page, cart_page, checkout_info_page,
                                      checkout_overview_page, checkout_complete_page, sidebar_menu):
     # Using helper functions - each will appear as a step in Allure report
@@ -94,6 +95,7 @@ def test_order_with_helper_functions(login_page, items_page, cart_page, checkout
 @allure.severity(allure.severity_level.NORMAL)
 @allure.description("Demonstrates nested steps for complex workflows")
 @pytest.mark.regression
+@pytest.mark.requires("login:standard_user")
 def test_nested_steps_example(login_page, items_page, cart_page):
 
     with allure.step("User Authentication"):
@@ -165,6 +167,7 @@ def test_multiple_user_login(login_page, items_page, username, expected_result):
 @allure.issue("JIRA-123", name="Related Jira Ticket")
 @allure.testcase("TC-001", name="Test Case ID")
 @pytest.mark.ui
+@pytest.mark.requires("login:standard_user")
 def test_with_links(login_page, items_page):
     """Test with external links in Allure report"""
 
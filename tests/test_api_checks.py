@@ -0,0 +1,76 @@
+import re
+import pytest
+import allure
+from utils.data_loader import load_test_params_from_csv
+
+# Rows with a "Known Failure" reason in the CSV are xfail
+test_data = load_test_params_from_csv("data/test_data.csv")
+
+
+def find_static_assets(html: str) -> list:
+    return re.findall(r'(?:src|href)="(/static/[^"]+)"', html)
+
+
+@pytest.fixture(scope="module")
+def login_url():
+    from pages.login_page import LoginPage
+    return LoginPage.BASE_URL
+
+
+@pytest.fixture(scope="module")
+def login_page_html(api_client, login_url):
+    return api_client.get(login_url).text()
+
+
+@pytest.fixture(scope="module")
+def app_bundle(api_client, login_page_html):
+    scripts = [asset for asset in find_static_assets(login_page_html) if asset.endswith(".js")]
+    return "\n".join(response.text() for response in api_client.get_many(scripts))
+
+
+@allure.epic("Environment")
+@allure.feature("HTTP Checks")
+@allure.title("Login Page is Served")
+@allure.severity(allure.severity_level.BLOCKER)
+@pytest.mark.api
+@pytest.mark.sanity
+def test_login_page_is_served(api_client, login_url):
+    with allure.step(f"GET {login_url}"):
+        response = api_client.get(login_url)
+
+    with allure.step("Verify the page is served with the app root"):
+        assert response.status == 200
+        assert "Swag Labs" in response.text()
+        assert find_static_assets(response.text()), "Login page references no static assets"
+
+
+@allure.epic("Environment")
+@allure.feature("HTTP Checks")
+@allure.title("Static Assets are Served")
+@allure.severity(allure.severity_level.CRITICAL)
+@pytest.mark.api
+@pytest.mark.sanity
+def test_static_assets_are_served(api_client, login_page_html):
+    assets = find_static_assets(login_page_html)
+
+    with allure.step(f"GET {len(assets)} static assets concurrently"):
+        responses = api_client.get_many(assets)
+        allure.attach("\n".join(f"{response.status} {response.url}" for response in responses),
+                      name="Asset Responses", attachment_type=allure.attachment_type.TEXT)
+
+    with allure.step("Verify every asset is served and not empty"):
+        broken = [f"{response.status} {response.url}" for response in responses if not response.ok or not response.body]
+        assert not broken, f"Broken static assets: {broken}"
+
+
+@allure.epic("Environment")
+@allure.feature("HTTP Checks")
+@allure.title("Login Error Messages are Bundled")
+@allure.severity(allure.severity_level.NORMAL)
+@pytest.mark.api
+@pytest.mark.sanity
+@pytest.mark.parametrize("username,password,error_message_text", test_data)
+def test_login_error_message_is_bundled(app_bundle, username: str, password: str, error_message_text: str):
+    with allure.step(f"Verify the app bundle contains: '{error_message_text}'"):
+        allure.attach(error_message_text, name="Expected Error Message", attachment_type=allure.attachment_type.TEXT)
+        assert error_message_text in app_bundle
@@ -10,6 +10,7 @@ items_to_add = ["Sauce Labs Backpack", "Sauce Labs Bike Light",
 @allure.severity(allure.severity_level.CRITICAL)
 @pytest.mark.regression
 @pytest.mark.checkout
+@pytest.mark.requires("login:standard_user")
 def test_e_2_e(login_page, items_page, cart_page,
                checkout_info_page, checkout_overview_page,
                checkout_complete_page, sidebar_menu) -> None:
@@ -45,17 +46,11 @@ def test_e_2_e(login_page, items_page, cart_page,
         checkout_info_page.click_continue_button()
 
     with allure.step("Verify checkout overview and complete the order"):
-        checkout_overview_page.validate_page_title_text("Checkout: Overview")
-        checkout_overview_page.validate_payment_info_label_is_visible()
-        checkout_overview_page.validate_shipping_info_label_text("Shipping Information:")
-        checkout_overview_page.validate_total_info_label_is_visible()
+        checkout_overview_page.validate_overview_details("Checkout: Overview", "Shipping Information:")
         checkout_overview_page.click_finish_button()
 
     with allure.step("Verify order completion message"):
-        checkout_complete_page.validate_complete_header_is_visible()
-        checkout_complete_page.validate_page_title_text("Checkout: Complete!")
-        checkout_complete_page.validate_complete_text("Your order has been dispatched, and will arrive just as fast as the pony can get there!")
-        checkout_complete_page.validate_back_to_products_button_is_visible()
+        checkout_complete_page.validate_order_completion("Checkout: Complete!", "Your order has been dispatched, and will arrive just as fast as the pony can get there!")
 
     with allure.step("Return to products page and logout"):
         checkout_complete_page.click_back_to_products_button()
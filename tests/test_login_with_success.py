@@ -14,6 +14,7 @@ import allure
 @pytest.mark.login_page
 @pytest.mark.skip_browser("webkit")
 @pytest.mark.regression
+@pytest.mark.provides("login:standard_user")
 def test_login_with_standard_user(login_page, items_page):
     with allure.step("Navigate to login page"):
         login_page.navigate_to_login_page()
@@ -36,6 +37,7 @@ def test_login_with_standard_user(login_page, items_page):
 @pytest.mark.login_page
 @pytest.mark.skip_browser("webkit")
 @pytest.mark.regression
+@pytest.mark.requires("login:standard_user")
 def test_login_with_problem_user(login_page, items_page):
     with allure.step("Navigate to login page"):
         login_page.navigate_to_login_page()
@@ -59,6 +61,7 @@ def test_login_with_problem_user(login_page, items_page):
 @pytest.mark.login_page
 @pytest.mark.skip_browser("webkit")
 @pytest.mark.regression
+@pytest.mark.requires("login:standard_user")
 def test_login_with_performance_glitch_user(login_page, items_page):
     with allure.step("Navigate to login page"):
         login_page.navigate_to_login_page()
@@ -81,6 +84,7 @@ def test_login_with_performance_glitch_user(login_page, items_page):
 @allure.severity(allure.severity_level.NORMAL)
 @pytest.mark.login_page
 @pytest.mark.regression
+@pytest.mark.requires("login:standard_user")
 def test_login_with_error_user(login_page, items_page):
     with allure.step("Navigate to login page"):
         login_page.navigate_to_login_page()
@@ -102,6 +106,7 @@ def test_login_with_error_user(login_page, items_page):
 @allure.severity(allure.severity_level.MINOR)
 @pytest.mark.login_page
 @pytest.mark.regression
+@pytest.mark.requires("login:standard_user")
 def test_login_with_visual_user(login_page, items_page):
     with allure.step("Navigate to login page"):
         login_page.navigate_to_login_page()
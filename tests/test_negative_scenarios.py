@@ -1,15 +1,9 @@
 import pytest
-import csv
 import allure
+from utils.data_loader import load_test_params_from_csv
 
-
-def load_test_data_from_csv(file_path):
-    with open(file_path, mode="r") as file:
-        reader = csv.reader(file)
-        next(reader)  # Skip the header row
-        return [tuple(row) for row in reader]
-
-test_data = load_test_data_from_csv("data/test_data.csv")
+# Rows with a "Known Failure" reason in the CSV are xfail, so they do not break the --sanity-gate
+test_data = load_test_params_from_csv("data/test_data.csv")
 
 @allure.epic("Authentication")
 @allure.feature("Login Validation")
@@ -0,0 +1,186 @@
+import json
+import pytest
+import allure
+from utils import impact
+from utils.matrix import build_manifest
+from utils.prerequisites import PrerequisiteGate, BLOCKED_MESSAGE
+
+# Plain checks (no browser) for the logic that decides which tests silently do not run
+
+pytestmark = [allure.epic("Framework"), allure.feature("Test Selection")]
+
+
+class FakeMark:
+
+    def __init__(self, name: str, *args):
+        self.name = name
+        self.args = args
+
+
+class FakeItem:
+    """Just enough of a pytest item: node id, path, markers and the browser_name parametrization."""
+
+    def __init__(self, nodeid: str, marks: list = (), browser_name: str = None, root=None):
+        self.nodeid = nodeid
+        self.path = (root / nodeid.split("::")[0]) if root else None
+        self._marks = list(marks)
+        if browser_name:
+            self.callspec = type("CallSpec", (), {"params": {"browser_name": browser_name}})()
+
+    def iter_markers(self, name: str):
+        return [mark for mark in self._marks if mark.name == name]
+
+    def get_closest_marker(self, name: str):
+        return next(iter(self.iter_markers(name)), None)
+
+
+class FakeReport:
+
+    def __init__(self, failed: bool = False, skipped: bool = False, longrepr: str = ""):
+        self.failed = failed
+        self.skipped = skipped
+        self.longrepr = longrepr
+
+
+@pytest.fixture
+def impact_root(tmp_path, monkeypatch):
+    """An empty repo root with its own impact map, so the checks never touch the real .impact_map.json."""
+    monkeypatch.setattr(impact, "_root_dir", tmp_path)
+    monkeypatch.setattr(impact, "_module_data_files", {})
+    impact_map = {
+        "tests/test_login_with_success.py::test_login_with_standard_user": {
+            "test_file": "tests/test_login_with_success.py",
+            "page_objects": ["pages/base_page.py", "pages/login_page.py", "pages/items_page.py"],
+            "methods": [], "data_files": [],
+        },
+        "tests/test_negative_scenarios.py::test_negative_scenarios": {
+            "test_file": "tests/test_negative_scenarios.py",
+            "page_objects": ["pages/base_page.py", "pages/login_page.py"],
+            "methods": [], "data_files": ["data/test_data.csv"],
+        },
+        "tests/test_e_2_e_scenario.py::test_e2e_purchase": {
+            "test_file": "tests/test_e_2_e_scenario.py",
+            "page_objects": ["pages/base_page.py", "pages/cart_page.py"],
+            "methods": [], "data_files": [],
+        },
+    }
+    (tmp_path / impact.IMPACT_MAP_FILE).write_text(json.dumps({"tests": impact_map}))
+    return tmp_path
+
+
+def impact_items(root) -> list:
+    return [
+        FakeItem("tests/test_login_with_success.py::test_login_with_standard_user", root=root),
+        FakeItem("tests/test_negative_scenarios.py::test_negative_scenarios", root=root),
+        FakeItem("tests/test_e_2_e_scenario.py::test_e2e_purchase", root=root),
+    ]
+
+
+def node_ids(items) -> list:
+    return [item.nodeid for item in items]
+
+
+@allure.title("Impact: a data-file change selects only the tests that load it")
+def test_data_file_change_selects_its_tests(impact_root):
+    selected, deselected = impact.select_impacted(impact_items(impact_root), {"data/test_data.csv"})
+
+    assert node_ids(selected) == ["tests/test_negative_scenarios.py::test_negative_scenarios"]
+    assert len(deselected) == 2
+
+
+@allure.title("Impact: a page-object change selects every test that uses it")
+def test_page_object_change_selects_its_users(impact_root):
+    selected, _ = impact.select_impacted(impact_items(impact_root), {"pages/login_page.py"})
+
+    assert node_ids(selected) == [
+        "tests/test_login_with_success.py::test_login_with_standard_user",
+        "tests/test_negative_scenarios.py::test_negative_scenarios",
+    ]
+
+
+@pytest.mark.parametrize("changed_file", ["tests/conftest.py", "utils/new_helper.py", "pytest.ini"])
+@allure.title("Impact: an unmapped Python or config file change runs everything")
+def test_unmapped_change_runs_everything(impact_root, changed_file: str):
+    items = impact_items(impact_root)
+
+    selected, deselected = impact.select_impacted(items, {changed_file})
+
+    assert selected == items
+    assert deselected == []
+
+
+@allure.title("Impact: unmapped non-Python files do not force a full run")
+def test_unmapped_non_python_change_is_ignored(impact_root):
+    selected, _ = impact.select_impacted(impact_items(impact_root), {"README.md"})
+
+    assert selected == []
+
+
+@allure.title("Impact: tests missing from the map always run")
+def test_unrecorded_test_is_selected(impact_root):
+    new_test = FakeItem("tests/test_new.py::test_new", root=impact_root)
+
+    selected, _ = impact.select_impacted(impact_items(impact_root) + [new_test], {"README.md"})
+
+    assert node_ids(selected) == ["tests/test_new.py::test_new"]
+
+
+@allure.title("Matrix: skip_browser and only_browser split items across browsers")
+def test_manifest_honours_every_browser_mark():
+    browsers = ["chromium", "firefox", "webkit"]
+    items = [
+        FakeItem(f"test_skip[{browser}]", [FakeMark("skip_browser", "firefox"), FakeMark("skip_browser", "webkit")],
+                 browser_name=browser)
+        for browser in browsers
+    ] + [
+        FakeItem(f"test_only[{browser}]", [FakeMark("only_browser", "firefox"), FakeMark("only_browser", "webkit")],
+                 browser_name=browser)
+        for browser in browsers
+    ] + [FakeItem("test_api")]
+
+    manifest = build_manifest(items, browsers)
+
+    assert manifest == {
+        "chromium": ["test_skip[chromium]", "test_api"],
+        "firefox": ["test_only[firefox]"],
+        "webkit": ["test_only[webkit]"],
+    }
+
+
+@allure.title("Prerequisites: a failed provider blocks its dependents on the same browser only")
+def test_failed_provider_blocks_dependents_per_browser():
+    gate = PrerequisiteGate()
+    provider = FakeItem("test_login[chromium]", [FakeMark("provides", "login")], browser_name="chromium")
+
+    gate.record_result(provider, FakeReport(failed=True))
+
+    requires_login = [FakeMark("requires", "login")]
+    assert gate.blocked_by(FakeItem("test_e2e[chromium]", requires_login, "chromium")) == ("login", provider.nodeid)
+    assert gate.blocked_by(FakeItem("test_e2e[firefox]", requires_login, "firefox")) is None
+    assert gate.blocked_by(FakeItem("test_other[chromium]", [], "chromium")) is None
+
+
+@allure.title("Prerequisites: a blocked provider blocks its own dependents")
+def test_blocked_provider_propagates():
+    gate = PrerequisiteGate()
+    gate.record_result(FakeItem("test_login", [FakeMark("provides", "login")]), FakeReport(failed=True))
+    cart = FakeItem("test_cart", [FakeMark("requires", "login"), FakeMark("provides", "cart")])
+    assert gate.blocked_by(cart) == ("login", "test_login")
+
+    gate.record_result(cart, FakeReport(skipped=True, longrepr=f"{BLOCKED_MESSAGE}: login"))
+
+    assert gate.blocked_by(FakeItem("test_checkout", [FakeMark("requires", "cart")])) == ("cart", "test_cart")
+
+
+@allure.title("Prerequisites: the sanity gate blocks non-sanity tests, but passes and xfails do not")
+def test_sanity_gate():
+    gate = PrerequisiteGate(sanity_gate=True)
+    regression = FakeItem("test_regression")
+
+    gate.record_result(FakeItem("test_sanity_pass", [FakeMark("sanity")]), FakeReport())
+    gate.record_result(FakeItem("test_sanity_xfail", [FakeMark("sanity")]), FakeReport(skipped=True, longrepr="xfail"))
+    assert gate.blocked_by(regression) is None
+
+    gate.record_result(FakeItem("test_sanity_fail", [FakeMark("sanity")]), FakeReport(failed=True))
+    assert gate.blocked_by(regression) == ("sanity", "test_sanity_fail")
+    assert gate.blocked_by(FakeItem("test_other_sanity", [FakeMark("sanity")])) is None
@@ -0,0 +1,80 @@
+import asyncio
+import threading
+from playwright.async_api import async_playwright
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ApiResponse:
+    """Plain snapshot of an APIResponse, safe to use after the request context is gone."""
+
+    def __init__(self, url: str, status: int, headers: dict, body: bytes):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status <= 299
+
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="replace")
+
+
+class ApiClient:
+    """
+    Browserless HTTP client built on Playwright's APIRequestContext.
+
+    The async API runs on its own event loop thread, so a single pooled request context can
+    serve concurrent batches (get_many) while tests keep calling plain synchronous methods.
+    """
+
+    def __init__(self, base_url: str, timeout: float = 10000):
+        self.base_url = base_url
+        self._timeout = timeout
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="api-client", daemon=True)
+        self._playwright = None
+        self._request_context = None
+
+    def _run(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def start(self):
+        self._thread.start()
+        self._run(self._start())
+        logger.info(f"API client started for {self.base_url}")
+
+    async def _start(self):
+        self._playwright = await async_playwright().start()
+        self._request_context = await self._playwright.request.new_context(
+            base_url=self.base_url, timeout=self._timeout)
+
+    def stop(self):
+        self._run(self._stop())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    async def _stop(self):
+        await self._request_context.dispose()
+        await self._playwright.stop()
+
+    async def _get(self, url: str) -> ApiResponse:
+        response = await self._request_context.get(url, max_redirects=0)
+        return ApiResponse(response.url, response.status, response.headers, await response.body())
+
+    def get(self, url: str) -> ApiResponse:
+        logger.info(f"GET {url}")
+        return self._run(self._get(url))
+
+    def get_many(self, urls: list) -> list:
+        """Sends all requests concurrently and returns the responses in the same order."""
+        logger.info(f"GET batch of {len(urls)} requests")
+
+        async def get_all():
+            return await asyncio.gather(*(self._get(url) for url in urls))
+
+        return self._run(get_all())
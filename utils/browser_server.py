@@ -0,0 +1,227 @@
+"""
+Warm browser server that is reused across pytest invocations.
+
+Start it once in a separate terminal, then point pytest at it:
+
+    python -m utils.browser_server start --browser chromium --channel chrome
+    pytest -m sanity --connect-browser
+    python -m utils.browser_server status
+    python -m utils.browser_server stop
+
+The server is Playwright's own browserType.launchServer(), run by the Node driver
+that ships with the playwright Python package. A small supervisor keeps it healthy
+and restarts it if the browser crashes.
+"""
+
+import argparse
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from playwright._impl._driver import compute_driver_executable, get_driver_env
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Next to pytest.ini, so the server and pytest find it from any working directory
+STATE_FILE = Path(__file__).resolve().parent.parent / ".browser-server.json"
+DEFAULT_PORT = 3900
+# Loopback only: anyone who can reach the websocket controls the browser, and there is no authentication
+HOST = "127.0.0.1"
+HEALTH_CHECK_INTERVAL_SECONDS = 5
+STARTUP_TIMEOUT_SECONDS = 60
+
+# Launches the server and prints its websocket endpoint; exits when the supervisor closes stdin
+LAUNCH_SERVER_SCRIPT = """
+const playwright = require(process.argv[1]);
+const options = JSON.parse(process.argv[2]);
+(async () => {
+  const server = await playwright[options.browser].launchServer(options.launchOptions);
+  console.log(server.wsEndpoint());
+  const shutdown = () => server.close().finally(() => process.exit(0));
+  process.stdin.on('end', shutdown);
+  process.stdin.resume();
+  process.on('SIGTERM', shutdown);
+})().catch(error => {
+  console.error(error);
+  process.exit(1);
+});
+"""
+
+
+class BrowserServer:
+
+    def __init__(self, browser: str = "chromium", channel: str = None, headless: bool = True,
+                 port: int = DEFAULT_PORT):
+        self.browser = browser
+        self.channel = channel
+        self.headless = headless
+        self.port = port
+        self.ws_endpoint = None
+        self.restarts = 0
+        self._process = None
+
+    def _launch_options(self) -> dict:
+        # No wsPath: Playwright picks a random one, and pytest reads the endpoint from the state file
+        launch_options = {"headless": self.headless, "host": HOST, "port": self.port}
+        if self.channel:
+            launch_options["channel"] = self.channel
+        return {"browser": self.browser, "launchOptions": launch_options}
+
+    def start(self):
+        node_path, cli_path = compute_driver_executable()
+        package_dir = str(Path(cli_path).parent)
+        self._process = subprocess.Popen(
+            [node_path, "-e", LAUNCH_SERVER_SCRIPT, package_dir, json.dumps(self._launch_options())],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, env=get_driver_env(),
+        )
+        self.ws_endpoint = self._read_endpoint()
+        logger.info(f"Browser server ({self.browser}) listening on {self.ws_endpoint}")
+
+    def _read_endpoint(self) -> str:
+        # readline() blocks, so give up from a watchdog thread if the launch hangs
+        watchdog = threading.Timer(STARTUP_TIMEOUT_SECONDS, self._process.kill)
+        watchdog.start()
+        try:
+            line = self._process.stdout.readline().strip()
+        finally:
+            watchdog.cancel()
+        if not line.startswith("ws://"):
+            self.stop()
+            raise RuntimeError("Browser server failed to start, see the driver output above")
+        return line
+
+    def stop(self):
+        if self._process and self._process.poll() is None:
+            self._process.stdin.close()
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+        self._process = None
+
+    def is_healthy(self) -> bool:
+        """The Node process is alive and its websocket port accepts connections."""
+        if self._process is None or self._process.poll() is not None:
+            return False
+        try:
+            with socket.create_connection((HOST, self.port), timeout=2):
+                return True
+        except OSError:
+            return False
+
+    def restart(self):
+        self.stop()
+        self.start()
+        self.restarts += 1
+
+    def state(self) -> dict:
+        return {
+            "pid": os.getpid(),
+            "browser": self.browser,
+            "channel": self.channel,
+            "ws_endpoint": self.ws_endpoint,
+            "restarts": self.restarts,
+        }
+
+
+def write_state(server: BrowserServer):
+    STATE_FILE.write_text(json.dumps(server.state(), indent=2))
+
+
+def _is_running(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # Alive, but owned by another user
+    return True
+
+
+def read_state() -> dict:
+    """Returns the running server's state; a state file left behind by a killed supervisor is removed."""
+    if not STATE_FILE.exists():
+        return None
+    state = json.loads(STATE_FILE.read_text())
+    if not _is_running(state["pid"]):
+        logger.warning(f"Removing stale browser server state, process {state['pid']} is not running")
+        STATE_FILE.unlink(missing_ok=True)
+        return None
+    return state
+
+
+def get_ws_endpoint(browser_name: str, channel: str = None) -> str:
+    """Returns the endpoint of the running server, used by the --connect-browser option."""
+    state = read_state()
+    if state is None:
+        raise RuntimeError("No browser server is running. Start one with: python -m utils.browser_server start")
+    if state["browser"] != browser_name:
+        raise RuntimeError(f"Browser server runs '{state['browser']}', but the test run needs '{browser_name}'")
+    if state["channel"] != channel:
+        raise RuntimeError(f"Browser server runs channel '{state['channel']}', but the test run needs '{channel}'. "
+                           f"Restart it with: python -m utils.browser_server start --browser {browser_name}"
+                           + (f" --channel {channel}" if channel else ""))
+    return state["ws_endpoint"]
+
+
+def run_supervisor(server: BrowserServer):
+    stop_requested = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop_requested.set())
+
+    server.start()
+    write_state(server)
+    try:
+        while not stop_requested.wait(HEALTH_CHECK_INTERVAL_SECONDS):
+            if not server.is_healthy():
+                logger.error("Browser server health check failed, restarting")
+                server.restart()
+                write_state(server)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        STATE_FILE.unlink(missing_ok=True)
+        logger.info("Browser server stopped")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Warm Playwright browser server for pytest --connect-browser")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    start_parser = subparsers.add_parser("start", help="Launch the browser server and keep it healthy")
+    start_parser.add_argument("--browser", default="chromium", choices=["chromium", "firefox", "webkit"])
+    start_parser.add_argument("--channel", default=None, help="Browser channel, e.g. 'chrome'")
+    start_parser.add_argument("--headed", action="store_true", help="Run the browser in headed mode")
+    start_parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    subparsers.add_parser("status", help="Show the running server")
+    subparsers.add_parser("stop", help="Stop the running server")
+
+    args = parser.parse_args(argv)
+    state = read_state()
+
+    if args.command == "start":
+        if state is not None:
+            parser.exit(1, f"Browser server already running: {state['ws_endpoint']}\n")
+        server = BrowserServer(args.browser, args.channel, headless=not args.headed, port=args.port)
+        run_supervisor(server)
+    elif args.command == "status":
+        if state is None:
+            parser.exit(1, "Browser server is not running\n")
+        print(json.dumps(state, indent=2))
+    elif args.command == "stop":
+        if state is None:
+            parser.exit(1, "Browser server is not running\n")
+        try:
+            os.kill(state["pid"], signal.SIGTERM)
+        except ProcessLookupError:
+            STATE_FILE.unlink(missing_ok=True)
+            parser.exit(1, "Browser server is not running\n")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,107 @@
+from pathlib import Path
+from utils import impact
+from utils.logger import get_logger
+
+# pytest internals: -k matching has no public API. Without them every file is collected normally.
+try:
+    from _pytest.mark import KeywordMatcher
+    from _pytest.mark.expression import Expression
+except ImportError:
+    KeywordMatcher = Expression = None
+
+logger = get_logger(__name__)
+
+CACHE_KEY = "collection/items"
+
+
+def _mtime(path) -> int:
+    try:
+        return Path(path).stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _signature(config) -> list:
+    """Everything besides the test file itself that changes the collected item names."""
+    return [
+        sorted(config.getoption("browser") or []),
+        config.getoption("browser_channel"),
+        _mtime(config.rootpath / "pytest.ini"),
+        _mtime(config.rootpath / "tests" / "conftest.py"),
+    ]
+
+
+class CollectionCache:
+    """
+    Remembers the keyword names of every collected item, keyed on file mtimes.
+    With -k, test files whose cached items cannot match are not imported at all.
+
+    If the pytest internals it relies on change, the cache disables itself and collection
+    falls back to importing every file.
+    """
+
+    def __init__(self, config):
+        self._config = config
+        self._cache = config.cache
+        self._signature = _signature(config)
+        cached = self._cache.get(CACHE_KEY, {})
+        self._files = cached.get("files", {}) if cached.get("signature") == self._signature else {}
+        self._collected = {}
+        self._enabled = KeywordMatcher is not None
+        self._expression = None
+        keyword_expression = config.option.keyword.lstrip()
+        if self._enabled and keyword_expression:
+            try:
+                self._expression = Expression.compile(keyword_expression)
+            except Exception:
+                # An invalid -k is reported by pytest itself when it deselects
+                self._expression = None
+
+    def _disable(self, error: Exception):
+        logger.warning(f"Collection cache disabled, pytest internals changed: {error!r}")
+        self._enabled = False
+        self._expression = None
+        self._collected = {}
+
+    def _is_fresh(self, path: str, entry: dict) -> bool:
+        if entry["mtime"] != _mtime(self._config.rootpath / path):
+            return False
+        return all(_mtime(self._config.rootpath / data_file) == mtime for data_file, mtime in entry["data_files"].items())
+
+    def can_skip(self, path) -> bool:
+        """True when -k is given and no cached item of this up-to-date test file matches it."""
+        if not self._enabled or self._expression is None:
+            return False
+        relative_path = impact.relative_path(path)
+        entry = self._files.get(relative_path)
+        if entry is None or not self._is_fresh(relative_path, entry):
+            return False
+        try:
+            return not any(self._expression.evaluate(KeywordMatcher(set(names))) for names in entry["items"])
+        except Exception as e:
+            self._disable(e)
+            return False
+
+    def add_item(self, item):
+        if not self._enabled:
+            return
+        try:
+            names = sorted(KeywordMatcher.from_item(item)._names)
+        except Exception as e:
+            self._disable(e)
+            return
+        relative_path = impact.relative_path(item.path)
+        entry = self._collected.setdefault(relative_path, {
+            "mtime": _mtime(item.path),
+            "data_files": {data_file: _mtime(self._config.rootpath / data_file)
+                           for data_file in impact.data_files_for_module(item.path)},
+            "items": [],
+        })
+        entry["items"].append(names)
+
+    def save(self):
+        # Node id selections (file.py::test) collect only part of a file, so they must not overwrite its entry
+        if not self._enabled or not self._collected or any("::" in arg for arg in self._config.args):
+            return
+        self._files.update(self._collected)
+        self._cache.set(CACHE_KEY, {"signature": self._signature, "files": self._files})
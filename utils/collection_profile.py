@@ -0,0 +1,103 @@
+import sys
+import time
+from importlib.abc import MetaPathFinder
+
+TOP_ENTRIES = 15
+
+
+class _TimedLoader:
+    """Wraps a module loader and measures how long executing the module takes."""
+
+    def __init__(self, loader, fullname: str, profile):
+        self._loader = loader
+        self._fullname = fullname
+        self._profile = profile
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._profile.start_import(self._fullname)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profile.finish_import(self._fullname)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _ImportTimer(MetaPathFinder):
+    """Meta path finder that delegates to the real finders and wraps their loaders with _TimedLoader."""
+
+    def __init__(self, profile):
+        self._profile = profile
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, fullname, self._profile)
+                return spec
+        return None
+
+
+class CollectionProfile:
+    """Import time per module and collection time per test file, reported at the end of the session."""
+
+    def __init__(self):
+        self._import_timer = _ImportTimer(self)
+        self._import_stack = []
+        self.imports = {}  # module name -> [cumulative seconds, self seconds]
+        self.files = {}  # test file -> collection seconds
+        self._file_starts = {}
+        self._collection_start = None
+        self.collection_seconds = None
+
+    def start(self):
+        sys.meta_path.insert(0, self._import_timer)
+        self._collection_start = time.perf_counter()
+
+    def stop(self):
+        if self._import_timer in sys.meta_path:
+            sys.meta_path.remove(self._import_timer)
+        if self._collection_start is not None:
+            self.collection_seconds = time.perf_counter() - self._collection_start
+
+    def start_import(self, module_name: str):
+        self._import_stack.append([module_name, time.perf_counter(), 0.0])
+
+    def finish_import(self, module_name: str):
+        _, started, nested = self._import_stack.pop()
+        elapsed = time.perf_counter() - started
+        self.imports[module_name] = [elapsed, elapsed - nested]
+        if self._import_stack:
+            self._import_stack[-1][2] += elapsed
+
+    def start_file(self, path: str):
+        self._file_starts[path] = time.perf_counter()
+
+    def finish_file(self, path: str):
+        if path in self._file_starts:
+            self.files[path] = time.perf_counter() - self._file_starts.pop(path)
+
+    def write_report(self, terminalreporter):
+        terminalreporter.write_sep("=", "collection profile")
+        if self.collection_seconds is not None:
+            terminalreporter.write_line(f"Total collection: {self.collection_seconds * 1000:.1f} ms")
+
+        terminalreporter.write_line("")
+        terminalreporter.write_line(f"{'Collection (ms)':>16}  Test file")
+        for path, seconds in sorted(self.files.items(), key=lambda entry: entry[1], reverse=True):
+            terminalreporter.write_line(f"{seconds * 1000:>16.1f}  {path}")
+
+        terminalreporter.write_line("")
+        terminalreporter.write_line(f"{'Cumulative (ms)':>16}{'Self (ms)':>11}  Module imported during collection")
+        slowest = sorted(self.imports.items(), key=lambda entry: entry[1][0], reverse=True)[:TOP_ENTRIES]
+        for module_name, (cumulative, own) in slowest:
+            terminalreporter.write_line(f"{cumulative * 1000:>16.1f}{own * 1000:>11.1f}  {module_name}")
+        terminalreporter.write_line("Modules imported before collection (pytest, plugins, conftest) are not listed: "
+                                    "use 'python -X importtime -m pytest --collect-only' for those.")
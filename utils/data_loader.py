@@ -0,0 +1,43 @@
+import csv
+from pathlib import Path
+import pytest
+from utils import impact
+
+# Set by conftest to pytest's cache (config.cache) so parsed data survives between runs
+_cache = None
+
+
+def configure_cache(cache):
+    global _cache
+    _cache = cache
+
+
+def load_test_data_from_csv(file_path):
+    impact.record_data_file(file_path)
+
+    stat = Path(file_path).stat()
+    cache_key = f"test_data/{impact.relative_path(file_path)}"
+    if _cache is not None:
+        cached = _cache.get(cache_key, None)
+        if cached and cached["mtime"] == stat.st_mtime_ns and cached["size"] == stat.st_size:
+            return [tuple(row) for row in cached["rows"]]
+
+    with open(file_path, mode="r") as file:
+        reader = csv.reader(file)
+        next(reader)  # Skip the header row
+        rows = [tuple(row) for row in reader]
+
+    if _cache is not None:
+        _cache.set(cache_key, {"mtime": stat.st_mtime_ns, "size": stat.st_size, "rows": rows})
+    return rows
+
+
+def load_test_params_from_csv(file_path):
+    """
+    Rows as pytest params for parametrize. The last column is "Known Failure": a row with a reason there
+    is marked xfail, so every test that uses the row expects it to fail without copying its values.
+    """
+    return [
+        pytest.param(*row[:-1], marks=pytest.mark.xfail(reason=row[-1])) if row[-1] else row[:-1]
+        for row in load_test_data_from_csv(file_path)
+    ]
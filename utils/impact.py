@@ -0,0 +1,203 @@
+import builtins
+import json
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+IMPACT_MAP_FILE = ".impact_map.json"
+
+# Changes to these files can affect any test, so they always trigger a full run
+FULL_RUN_FILES = {"pytest.ini", "requirements.txt"}
+
+# Imports of these packages are recorded even when no action method is called (e.g. reading LoginPage.BASE_URL)
+PAGE_OBJECT_PACKAGES = ("pages",)
+
+_root_dir = Path.cwd()
+_recording = False
+_current_test = None
+_collecting_module = None
+_usage = {}
+_module_data_files = {}
+_module_page_objects = {}
+_original_import = None
+
+
+def configure(root_dir, recording: bool = False):
+    global _root_dir, _recording
+    _root_dir = Path(root_dir)
+    _recording = recording
+    if recording:
+        _install_import_hook()
+
+
+def _install_import_hook():
+    """
+    Wraps __import__ so every executed import of a page-object module is recorded, including cached
+    imports inside fixtures. The module is attributed to the test module being collected or run.
+    """
+    global _original_import
+    if _original_import is not None:
+        return
+    _original_import = builtins.__import__
+
+    def recording_import(name, globals=None, locals=None, fromlist=(), level=0):
+        module = _original_import(name, globals, locals, fromlist, level)
+        if level == 0 and name.split(".")[0] in PAGE_OBJECT_PACKAGES:
+            names = [name] + [f"{name}.{attribute}" for attribute in fromlist or ()]
+            _record_page_object_imports(names)
+        return module
+
+    builtins.__import__ = recording_import
+
+
+def _record_page_object_imports(module_names: list):
+    if _current_test is not None:
+        test_module = relative_path(_root_dir / _current_test.split("::")[0])
+    elif _collecting_module is not None:
+        test_module = _collecting_module
+    else:
+        return
+    for module_name in module_names:
+        module_file = getattr(sys.modules.get(module_name), "__file__", None)
+        if module_file and not module_file.endswith("__init__.py"):
+            _module_page_objects.setdefault(test_module, set()).add(relative_path(module_file))
+
+
+def is_recording() -> bool:
+    return _recording
+
+
+def relative_path(path) -> str:
+    """Returns the path relative to the repo root in posix form, e.g. 'pages/login_page.py'."""
+    path = Path(path).resolve()
+    try:
+        return path.relative_to(_root_dir.resolve()).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def start_test(nodeid: str):
+    global _current_test
+    _current_test = nodeid
+    if _recording:
+        _usage[nodeid] = {"page_objects": set(), "methods": set()}
+
+
+def finish_test():
+    global _current_test
+    _current_test = None
+
+
+def start_module_collection(path):
+    global _collecting_module
+    _collecting_module = relative_path(path)
+
+
+def record_page_object_usage(page_object, method_name: str):
+    """Called from the BasePage action path: remembers which page-object modules and methods the running test used."""
+    if not _recording or _current_test is None:
+        return
+    usage = _usage[_current_test]
+    # Include base classes so a change in base_page.py impacts every page-object user
+    for cls in type(page_object).__mro__:
+        module = sys.modules.get(cls.__module__)
+        module_file = getattr(module, "__file__", None)
+        if module_file and cls is not object:
+            usage["page_objects"].add(relative_path(module_file))
+    usage["methods"].add(f"{type(page_object).__name__}.{method_name}")
+
+
+def record_data_file(path):
+    """Called by data loaders during collection: links the data file to the test module being collected."""
+    if _collecting_module is None:
+        return
+    _module_data_files.setdefault(_collecting_module, set()).add(relative_path(path))
+
+
+def data_files_for_module(path) -> set:
+    return _module_data_files.get(relative_path(path), set())
+
+
+def page_objects_imported_by_module(path) -> set:
+    """Page-object modules imported while the test module was collected or any of its tests ran."""
+    return _module_page_objects.get(relative_path(path), set())
+
+
+def load_impact_map() -> dict:
+    map_path = _root_dir / IMPACT_MAP_FILE
+    if not map_path.exists():
+        return {}
+    with open(map_path, "r") as file:
+        return json.load(file).get("tests", {})
+
+
+def save_impact_map(items):
+    """Merges the usage recorded in this session into the impact map on disk."""
+    impact_map = load_impact_map()
+    for item in items:
+        if item.nodeid not in _usage:
+            continue
+        usage = _usage[item.nodeid]
+        impact_map[item.nodeid] = {
+            "test_file": relative_path(item.path),
+            "page_objects": sorted(usage["page_objects"] | page_objects_imported_by_module(item.path)),
+            "methods": sorted(usage["methods"]),
+            "data_files": sorted(data_files_for_module(item.path)),
+        }
+    with open(_root_dir / IMPACT_MAP_FILE, "w") as file:
+        json.dump({"tests": impact_map}, file, indent=2, sort_keys=True)
+    logger.info(f"Impact map saved: {len(impact_map)} tests in {IMPACT_MAP_FILE}")
+
+
+def _git_lines(*args) -> set:
+    try:
+        result = subprocess.run(["git", *args], cwd=_root_dir, capture_output=True, text=True, check=True)
+    except subprocess.CalledProcessError as e:
+        raise pytest.UsageError(f"git {' '.join(args)} failed: {e.stderr.strip()}") from None
+    return {line.strip() for line in result.stdout.splitlines() if line.strip()}
+
+
+def changed_files_since(git_ref: str) -> set:
+    """Returns files changed between the git ref and the working tree, including untracked files."""
+    changed_files = _git_lines("diff", "--name-only", git_ref)
+    changed_files |= _git_lines("ls-files", "--others", "--exclude-standard")
+    return changed_files
+
+
+def select_impacted(items, changed_files: set):
+    """Splits items into (selected, deselected) based on the changed files and the impact map."""
+    impact_map = load_impact_map()
+    test_files = {relative_path(item.path) for item in items}
+    mapped_files = set()
+    for entry in impact_map.values():
+        mapped_files.update(entry["page_objects"], entry["data_files"])
+    for item in items:
+        mapped_files.update(data_files_for_module(item.path))
+
+    unmapped = {
+        path for path in changed_files
+        if path not in mapped_files and path not in test_files
+        and (path.endswith(".py") or path in FULL_RUN_FILES)
+    }
+    if unmapped:
+        logger.info(f"Changed files not covered by the impact map, running all tests: {sorted(unmapped)}")
+        return list(items), []
+
+    selected, deselected = [], []
+    for item in items:
+        entry = impact_map.get(item.nodeid)
+        if entry is None:
+            # Never recorded (e.g. a new test) - run it to be safe
+            selected.append(item)
+            continue
+        touched = {relative_path(item.path)} | set(entry["page_objects"]) | set(entry["data_files"])
+        touched |= data_files_for_module(item.path)
+        if touched & changed_files:
+            selected.append(item)
+        else:
+            deselected.append(item)
+    return selected, deselected
@@ -0,0 +1,191 @@
+"""
+Cross-browser matrix run: each browser runs in its own pytest process, all at the same time.
+
+    python -m utils.matrix
+    python -m utils.matrix --browsers chromium firefox -- -m sanity
+
+1. A shared collection pass with every browser selected only computes the manifest: the node ids
+   each browser should run, honouring skip_browser/only_browser and any -k/-m selection, plus the
+   file/node id arguments pytest parsed from the command line.
+2. One pytest process per browser collects and runs its node ids, with its own --output folder
+   and the remaining pytest options (file/node id arguments are replaced by the node ids).
+   A matrix run therefore collects 1 + N times; the extra pass buys the browser split and lets
+   the runner skip browsers with nothing to run.
+3. All processes write to the same allure-results folder; every result carries the
+   browser_name parameter, so `allure serve allure-results` shows one merged report.
+"""
+
+import argparse
+import configparser
+import json
+import shlex
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+BROWSERS = ["chromium", "firefox", "webkit"]
+# Options that are set per browser process, so they are stripped from the ini addopts
+PER_BROWSER_OPTIONS = {"--browser", "--browser-channel", "--output"}
+
+
+def read_addopts(ini_path: Path = Path("pytest.ini")) -> list:
+    parser = configparser.ConfigParser()
+    parser.read(ini_path)
+    return shlex.split(parser.get("pytest", "addopts", fallback=""))
+
+
+def split_browser_options(addopts: list):
+    """Returns (addopts without per-browser options, configured chromium channel)."""
+    remaining, channel = [], None
+    args = iter(addopts)
+    for arg in args:
+        name, has_value, value = arg.partition("=")
+        if name in PER_BROWSER_OPTIONS:
+            if not has_value:
+                value = next(args, None)
+            if name == "--browser-channel":
+                channel = value
+            continue
+        remaining.append(arg)
+    return remaining, channel
+
+
+def option_value(args: list, name: str):
+    for index, arg in enumerate(args):
+        if arg == name and index + 1 < len(args):
+            return args[index + 1]
+        if arg.startswith(f"{name}="):
+            return arg.split("=", 1)[1]
+    return None
+
+
+def strip_positional_args(pytest_args: list, positional_args: list) -> list:
+    """Removes the file/node id arguments pytest parsed, keeping option values that only look like paths."""
+    remaining_positionals = list(positional_args)
+    run_args = []
+    for arg in pytest_args:
+        if not arg.startswith("-") and arg in remaining_positionals:
+            remaining_positionals.remove(arg)
+            continue
+        run_args.append(arg)
+    return run_args
+
+
+def collect_manifest(browsers: list, addopts: list, pytest_args: list) -> dict:
+    """Single collection pass for all browsers; returns {"node_ids": {browser: [node ids]}, "positional_args": [...]}."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manifest_path = Path(temp_dir) / "manifest.json"
+        # --matrix-manifest=PATH, not two tokens: the option is only known once tests/conftest.py is loaded,
+        # and until then a separate PATH would be taken as a test path
+        command = [sys.executable, "-m", "pytest", "--collect-only", "-qq",
+                   "-o", f"addopts={shlex.join(addopts)}",
+                   *[option for browser in browsers for option in ("--browser", browser)],
+                   f"--matrix-manifest={manifest_path}", *pytest_args]
+        result = subprocess.run(command, capture_output=True, text=True)
+        # Exit code 5 means nothing was selected, which still writes an (empty) manifest
+        if result.returncode not in (0, 5) or not manifest_path.exists():
+            sys.stderr.write(result.stdout + result.stderr)
+            raise RuntimeError(f"Matrix collection failed with exit code {result.returncode}")
+        return json.loads(manifest_path.read_text())
+
+
+def write_manifest(config, items, manifest_path: str):
+    """Called by the --matrix-manifest collection pass."""
+    browsers = config.getoption("browser") or ["chromium"]
+    # Only what was given on the command line; testpaths fallbacks are not in the matrix pytest args
+    positional_args = list(config.args) if config.args_source == config.ArgsSource.ARGS else []
+    manifest = {"node_ids": build_manifest(items, browsers), "positional_args": positional_args}
+    Path(manifest_path).write_text(json.dumps(manifest))
+
+
+def build_manifest(items, browsers: list) -> dict:
+    """Assigns collected items to browsers. Tests without a browser run once, with the first browser."""
+    manifest = {browser: [] for browser in browsers}
+    for item in items:
+        browser_name = item.callspec.params.get("browser_name") if hasattr(item, "callspec") else None
+        if browser_name is None:
+            manifest[browsers[0]].append(item.nodeid)
+            continue
+        # Every mark counts, from the function up to the module, like pytest-playwright's own skip list
+        only_browsers = [marker.args[0] for marker in item.iter_markers("only_browser")]
+        skip_browsers = [marker.args[0] for marker in item.iter_markers("skip_browser")]
+        if only_browsers and browser_name not in only_browsers:
+            continue
+        if browser_name in skip_browsers:
+            continue
+        manifest[browser_name].append(item.nodeid)
+    return manifest
+
+
+def run_matrix(browsers: list, pytest_args: list) -> int:
+    addopts, channel = split_browser_options(read_addopts())
+    # A --browser-channel on the command line overrides the ini one, like in a plain pytest run
+    pytest_args, args_channel = split_browser_options(pytest_args)
+    channel = args_channel or channel
+    # Every process writes into the same results folder, so clean it once here instead
+    if "--clean-alluredir" in pytest_args or "--clean-alluredir" in addopts:
+        allure_dir = option_value(pytest_args, "--alluredir") or option_value(addopts, "--alluredir")
+        if allure_dir:
+            shutil.rmtree(allure_dir, ignore_errors=True)
+        addopts = [arg for arg in addopts if arg != "--clean-alluredir"]
+        pytest_args = [arg for arg in pytest_args if arg != "--clean-alluredir"]
+
+    manifest = collect_manifest(browsers, addopts, pytest_args)
+    run_args = strip_positional_args(pytest_args, manifest["positional_args"])
+    results_root = Path("test-results")
+    results_root.mkdir(exist_ok=True)
+
+    processes = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for browser, node_ids in manifest["node_ids"].items():
+            if not node_ids:
+                logger.info(f"[{browser}] nothing to run")
+                continue
+            args_file = Path(temp_dir) / f"{browser}.args"
+            args_file.write_text("\n".join(node_ids))
+            command = [sys.executable, "-m", "pytest", f"@{args_file}",
+                       "-o", f"addopts={shlex.join(addopts)}", "-p", "no:cacheprovider",
+                       "--browser", browser, "--output", str(results_root / browser), *run_args]
+            if browser == "chromium" and channel:
+                command += ["--browser-channel", channel]
+            log_path = results_root / f"matrix-{browser}.log"
+            logger.info(f"[{browser}] running {len(node_ids)} tests, log: {log_path}")
+            log_file = open(log_path, "w")
+            processes[browser] = (subprocess.Popen(command, stdout=log_file, stderr=subprocess.STDOUT),
+                                  log_file, time.monotonic())
+
+        exit_codes = {}
+        for browser, (process, log_file, started) in processes.items():
+            exit_codes[browser] = process.wait()
+            log_file.close()
+            logger.info(f"[{browser}] finished with exit code {exit_codes[browser]} "
+                        f"in {time.monotonic() - started:.1f}s")
+
+    # pytest exit code 5 means no tests collected, which is fine for a browser with everything skipped
+    failed = {browser: code for browser, code in exit_codes.items() if code not in (0, 5)}
+    return max(failed.values()) if failed else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Run the suite on several browsers in parallel with a single collection pass",
+        epilog="Arguments after '--' are passed to pytest, e.g. -- -m sanity")
+    parser.add_argument("--browsers", nargs="+", default=BROWSERS, choices=BROWSERS)
+    parser.add_argument("pytest_args", nargs=argparse.REMAINDER)
+    args = parser.parse_args(argv)
+    pytest_args = args.pytest_args[1:] if args.pytest_args[:1] == ["--"] else args.pytest_args
+    per_process = sorted({arg.partition("=")[0] for arg in pytest_args} & (PER_BROWSER_OPTIONS - {"--browser-channel"}))
+    if per_process:
+        parser.error(f"{', '.join(per_process)} is set for each browser process: pick browsers with --browsers, "
+                     f"results go to test-results/<browser>")
+    return run_matrix(args.browsers, pytest_args)
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
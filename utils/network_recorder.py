@@ -0,0 +1,158 @@
+import heapq
+import json
+import time
+from pathlib import Path
+import allure
+import allure_commons
+from playwright.sync_api import BrowserContext, Request
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+SLOWEST_RESOURCES = 5
+TIMING_PHASES = [
+    ("dns", "domainLookupStart", "domainLookupEnd"),
+    ("connect", "connectStart", "connectEnd"),
+    ("tls", "secureConnectionStart", "connectEnd"),
+    ("wait", "requestStart", "responseStart"),
+    ("download", "responseStart", "responseEnd"),
+]
+
+
+def _phase_duration(timing: dict, start_key: str, end_key: str):
+    start, end = timing.get(start_key, -1), timing.get(end_key, -1)
+    return round(end - start, 1) if start >= 0 and end >= 0 else None
+
+
+class _StepSummary:
+    """Running totals for one step - only the N slowest requests are kept, not the full waterfall."""
+
+    def __init__(self, title: str):
+        self.title = title
+        self.count = 0
+        self.failed = 0
+        self.total_bytes = 0
+        self._slowest = []
+
+    def add(self, record: dict):
+        self.count += 1
+        self.total_bytes += record["transfer_bytes"] or 0
+        if record["failure"]:
+            self.failed += 1
+        if record["duration_ms"] is not None:
+            entry = (record["duration_ms"], self.count, record)
+            if len(self._slowest) < SLOWEST_RESOURCES:
+                heapq.heappush(self._slowest, entry)
+            else:
+                heapq.heappushpop(self._slowest, entry)
+
+    def to_table(self) -> str:
+        lines = [
+            f"Step: {self.title}",
+            f"Requests: {self.count} ({self.failed} failed), transferred: {self.total_bytes / 1024:.1f} KB",
+            "",
+            f"{'Duration (ms)':>14}  {'Status':>6}  {'Type':<12} {'Size (KB)':>9}  URL",
+        ]
+        for duration, _, record in sorted(self._slowest, reverse=True):
+            status = record["status"] if record["status"] is not None else "-"
+            size = (record["transfer_bytes"] or 0) / 1024
+            lines.append(f"{duration:>14.1f}  {status:>6}  {record['resource_type']:<12} {size:>9.1f}  {record['url']}")
+        return "\n".join(lines)
+
+
+class NetworkRecorder:
+    """
+    Per-test network waterfall: every finished or failed request is streamed as one JSON line,
+    tagged with the allure.step it started in. Each step gets a summary table attached when it ends.
+    """
+
+    def __init__(self, output_path: Path, test_name: str):
+        self.output_path = output_path
+        self._test_summary = _StepSummary(test_name)
+        self._step_stack = []
+        self._request_steps = {}
+        self._context = None
+        self._file = None
+
+    def start(self, context: BrowserContext):
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.output_path, "w", buffering=1)
+        self._context = context
+        context.on("request", self._on_request)
+        context.on("requestfinished", self._on_request_finished)
+        context.on("requestfailed", self._on_request_failed)
+        allure_commons.plugin_manager.register(self)
+
+    def stop(self):
+        allure_commons.plugin_manager.unregister(self)
+        if self._context is not None:
+            self._context.remove_listener("request", self._on_request)
+            self._context.remove_listener("requestfinished", self._on_request_finished)
+            self._context.remove_listener("requestfailed", self._on_request_failed)
+        if self._file is not None:
+            self._file.close()
+        logger.info(f"Network waterfall: {self._test_summary.count} requests saved to {self.output_path}")
+
+    def attach_to_report(self):
+        allure.attach(self._test_summary.to_table(), name="Network Summary", attachment_type=allure.attachment_type.TEXT)
+        allure.attach.file(str(self.output_path), name="Network Waterfall (JSONL)",
+                           attachment_type=allure.attachment_type.JSON, extension="jsonl")
+
+    # Allure step hooks: keep track of the step each request starts in
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        self._step_stack.append(_StepSummary(title))
+
+    @allure_commons.hookimpl(tryfirst=True)
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        # tryfirst: the step is still open in Allure, so the summary is attached inside it
+        if not self._step_stack:
+            return
+        summary = self._step_stack.pop()
+        if summary.count:
+            allure.attach(summary.to_table(), name="Network Summary", attachment_type=allure.attachment_type.TEXT)
+
+    def _on_request(self, request: Request):
+        self._request_steps[request] = (list(self._step_stack), time.time())
+
+    def _on_request_finished(self, request: Request):
+        self._record(request, failure=None)
+
+    def _on_request_failed(self, request: Request):
+        self._record(request, failure=request.failure)
+
+    def _record(self, request: Request, failure):
+        steps, started = self._request_steps.pop(request, ([], time.time()))
+        timing = request.timing
+        response = None
+        sizes = {}
+        if failure is None:
+            try:
+                response = request.response()
+                sizes = request.sizes()
+            except Exception as e:
+                logger.debug(f"Could not read response details for {request.url}: {e}")
+
+        response_end = timing.get("responseEnd", -1)
+        transfer_bytes = None
+        if sizes:
+            transfer_bytes = sizes["responseBodySize"] + sizes["responseHeadersSize"]
+        record = {
+            "url": request.url,
+            "method": request.method,
+            "resource_type": request.resource_type,
+            "status": response.status if response else None,
+            "failure": failure,
+            "step": " > ".join(step.title for step in steps),
+            "started_at": round(timing.get("startTime", started * 1000), 1),
+            "duration_ms": round(response_end, 1) if response_end >= 0 else None,
+            "phases_ms": {name: _phase_duration(timing, start, end) for name, start, end in TIMING_PHASES},
+            "transfer_bytes": transfer_bytes,
+        }
+        self._file.write(json.dumps(record) + "\n")
+
+        self._test_summary.add(record)
+        for step in steps:
+            # Steps that already ended are no longer summarized
+            if step in self._step_stack:
+                step.add(record)
@@ -0,0 +1,89 @@
+import json
+from pathlib import Path
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+SANITY = "sanity"
+API = "api"
+BLOCKED_MESSAGE = "Blocked by failed prerequisite"
+
+ALLURE_CATEGORIES = [
+    {
+        "name": "Blocked by failed prerequisite",
+        "matchedStatuses": ["skipped"],
+        "messageRegex": f".*{BLOCKED_MESSAGE}.*",
+    },
+]
+
+
+def _browser_name(item):
+    """The pytest-playwright browser of a parametrized item, None for browserless tests."""
+    callspec = getattr(item, "callspec", None)
+    return callspec.params.get("browser_name") if callspec else None
+
+
+class PrerequisiteGate:
+    """
+    Tests declare what they prove with @pytest.mark.provides("name") and what they need with
+    @pytest.mark.requires("name"). Providers run first; once a provider fails, every test that
+    requires it is skipped as blocked instead of waiting for its own timeouts.
+
+    With sanity_gate, every sanity test provides "sanity" and every other test requires it.
+
+    Prerequisites are tracked per browser: a chromium failure only blocks chromium dependents.
+    Browserless tests (the api tier) break a prerequisite for every browser.
+    """
+
+    def __init__(self, sanity_gate: bool = False):
+        self._sanity_gate = sanity_gate
+        self._broken = {}  # (prerequisite name, browser name or None) -> nodeid of the test that broke it
+
+    def provides(self, item) -> set:
+        names = {name for mark in item.iter_markers("provides") for name in mark.args}
+        if self._sanity_gate and item.get_closest_marker(SANITY):
+            names.add(SANITY)
+        return names
+
+    def requires(self, item) -> set:
+        names = {name for mark in item.iter_markers("requires") for name in mark.args}
+        if self._sanity_gate and not item.get_closest_marker(SANITY):
+            names.add(SANITY)
+        return names - self.provides(item)
+
+    def prioritize(self, items):
+        """Stable sort: sanity tier first (browserless api checks leading it), then providers before dependents."""
+        items.sort(key=lambda item: (
+            item.get_closest_marker(SANITY) is None,
+            item.get_closest_marker(API) is None,
+            not self.provides(item),
+        ))
+
+    def blocked_by(self, item):
+        """Returns (prerequisite, nodeid of the failed provider) if the item cannot pass, else None."""
+        browser_name = _browser_name(item)
+        for name in sorted(self.requires(item)):
+            for key in ((name, browser_name), (name, None)):
+                if key in self._broken:
+                    return name, self._broken[key]
+        return None
+
+    def record_result(self, item, report):
+        """A provider that fails in setup or call (or is itself blocked) breaks everything it provides."""
+        blocked = report.skipped and BLOCKED_MESSAGE in str(report.longrepr)
+        if not (report.failed or blocked):
+            return
+        browser_name = _browser_name(item)
+        for name in self.provides(item):
+            if (name, browser_name) not in self._broken:
+                logger.error(f"Prerequisite '{name}' failed in {item.nodeid}, dependent tests will be skipped")
+                self._broken[(name, browser_name)] = item.nodeid
+
+
+def write_allure_categories(allure_dir: str):
+    """Adds the 'blocked' category to the Allure results, unless a categories.json is already there."""
+    categories_path = Path(allure_dir) / "categories.json"
+    if categories_path.exists():
+        return
+    categories_path.parent.mkdir(parents=True, exist_ok=True)
+    categories_path.write_text(json.dumps(ALLURE_CATEGORIES, indent=2))
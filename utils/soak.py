@@ -0,0 +1,275 @@
+"""
+Soak runner: repeats the e2e purchase journey in one browser and context for a long time
+and samples browser and framework memory into a time-series CSV.
+
+    python -m utils.soak --duration 4h --interval 60
+    python -m utils.soak --analyze soak-results/soak.csv
+
+At the end every metric gets a linear trend (slope per hour, after a warm-up) and the run
+fails if any slope is above its leak threshold. Memory metrics come from the Chrome DevTools
+Protocol, so the runner needs a Chromium-based browser.
+"""
+
+import argparse
+import csv
+import gc
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+import allure_commons
+from playwright.sync_api import sync_playwright, Page
+from pages.base_page import BasePage
+from pages.login_page import LoginPage
+from pages.items_page import ItemsPage
+from pages.cart_page import CartPage
+from pages.checkout_info_page import CheckoutInfoPage
+from pages.checkout_overview_page import CheckoutOverviewPage
+from pages.checkout_complete_page import CheckoutCompletePage
+from pages.sidebar_menu import SidebarMenu
+from utils.logger import get_logger
+from utils.network_recorder import NetworkRecorder
+
+logger = get_logger(__name__)
+
+ITEMS_TO_ADD = ["Sauce Labs Backpack", "Sauce Labs Bike Light", "Sauce Labs Bolt T-Shirt"]
+
+# Fraction of samples ignored before fitting the trend: caches and JIT settle during warm-up
+WARMUP_FRACTION = 0.2
+MIN_SAMPLES_FOR_TREND = 5
+
+# Growth per hour above which a metric is reported as a leak
+LEAK_THRESHOLDS_PER_HOUR = {
+    "js_heap_used_mb": 5.0,
+    "dom_nodes": 500.0,
+    "js_event_listeners": 100.0,
+    "documents": 1.0,
+    "browser_rss_mb": 50.0,
+    "python_rss_mb": 10.0,
+    "logger_handlers": 0.5,
+    "live_page_objects": 1.0,
+    "allure_plugins": 0.5,
+}
+
+CSV_COLUMNS = ["timestamp", "elapsed_s", "iteration", "failed_iterations"] + list(LEAK_THRESHOLDS_PER_HOUR)
+
+
+def purchase_journey(page: Page):
+    """The e2e purchase flow, with page objects created per iteration just like the test fixtures do."""
+    login_page = LoginPage(page)
+    items_page = ItemsPage(page)
+    cart_page = CartPage(page)
+    checkout_info_page = CheckoutInfoPage(page)
+    checkout_overview_page = CheckoutOverviewPage(page)
+    checkout_complete_page = CheckoutCompletePage(page)
+    sidebar_menu = SidebarMenu(page)
+
+    login_page.navigate_to_login_page()
+    login_page.fill_username("standard_user")
+    login_page.type_password("secret_sauce")
+    login_page.click_login_button()
+    items_page.validate_page_url()
+
+    for item in ITEMS_TO_ADD:
+        items_page.add_item_to_basket(item)
+    items_page.validate_added_items_amount(len(ITEMS_TO_ADD))
+    items_page.click_shopping_cart_link()
+
+    cart_page.validate_page_title_text("Your Cart")
+    cart_page.click_checkout_button()
+
+    checkout_info_page.fill_first_name("Soak")
+    checkout_info_page.fill_last_name("Runner")
+    checkout_info_page.fill_postal_code("20100")
+    checkout_info_page.click_continue_button()
+
+    checkout_overview_page.validate_overview_details("Checkout: Overview", "Shipping Information:")
+    checkout_overview_page.click_finish_button()
+    checkout_complete_page.validate_order_completion(
+        "Checkout: Complete!", "Your order has been dispatched, and will arrive just as fast as the pony can get there!")
+
+    checkout_complete_page.click_back_to_products_button()
+    sidebar_menu.click_menu_button()
+    sidebar_menu.click_reset_sidebar_link()
+    sidebar_menu.click_logout_sidebar_link()
+    login_page.validate_login_container_is_visible()
+
+
+def reset_session(page: Page):
+    """Drops whatever a failed iteration left behind (session cookie, cart), so the next one starts clean."""
+    page.context.clear_cookies()
+    try:
+        page.evaluate("window.localStorage.clear()")
+    except Exception as e:
+        logger.warning(f"Could not clear local storage: {e}")
+
+
+def _rss_mb(pid) -> float:
+    """Resident set size from /proc (Linux only), None elsewhere."""
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+    return None
+
+
+class MetricsSampler:
+
+    def __init__(self, browser, page: Page):
+        self._page_cdp = page.context.new_cdp_session(page)
+        self._page_cdp.send("Performance.enable")
+        self._browser_cdp = browser.new_browser_cdp_session()
+
+    def _browser_rss_mb(self) -> float:
+        """Sums RSS over the browser, GPU, utility and renderer processes."""
+        process_info = self._browser_cdp.send("SystemInfo.getProcessInfo")["processInfo"]
+        sizes = [_rss_mb(process["id"]) for process in process_info]
+        sizes = [size for size in sizes if size is not None]
+        return round(sum(sizes), 1) if sizes else None
+
+    def sample(self) -> dict:
+        metrics = {metric["name"]: metric["value"] for metric in self._page_cdp.send("Performance.getMetrics")["metrics"]}
+        gc.collect()
+        python_rss = _rss_mb(os.getpid())
+        return {
+            "js_heap_used_mb": round(metrics["JSHeapUsedSize"] / (1024 * 1024), 2),
+            "dom_nodes": int(metrics["Nodes"]),
+            "js_event_listeners": int(metrics["JSEventListeners"]),
+            "documents": int(metrics["Documents"]),
+            "browser_rss_mb": self._browser_rss_mb(),
+            "python_rss_mb": round(python_rss, 1) if python_rss is not None else None,
+            "logger_handlers": sum(len(logger_.handlers) for logger_ in logging.Logger.manager.loggerDict.values()
+                                   if isinstance(logger_, logging.Logger)),
+            "live_page_objects": sum(1 for obj in gc.get_objects() if isinstance(obj, BasePage)),
+            "allure_plugins": len(allure_commons.plugin_manager.get_plugins()),
+        }
+
+
+def slope_per_hour(points: list) -> float:
+    """Least-squares slope of (elapsed seconds, value) points, scaled to units per hour."""
+    count = len(points)
+    mean_x = sum(x for x, _ in points) / count
+    mean_y = sum(y for _, y in points) / count
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if variance == 0:
+        return 0.0
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    return covariance / variance * 3600
+
+
+def detect_leaks(csv_path: Path, thresholds: dict = LEAK_THRESHOLDS_PER_HOUR) -> dict:
+    """Returns {metric: slope per hour} for every metric whose trend is above its threshold."""
+    with open(csv_path, newline="") as file:
+        rows = list(csv.DictReader(file))
+    rows = rows[int(len(rows) * WARMUP_FRACTION):]
+    if len(rows) < MIN_SAMPLES_FOR_TREND:
+        logger.warning(f"Only {len(rows)} samples after warm-up, at least {MIN_SAMPLES_FOR_TREND} are needed for a trend")
+        return {}
+
+    leaks = {}
+    for metric, threshold in thresholds.items():
+        points = [(float(row["elapsed_s"]), float(row[metric])) for row in rows if row.get(metric)]
+        if len(points) < MIN_SAMPLES_FOR_TREND:
+            continue
+        slope = slope_per_hour(points)
+        logger.info(f"Trend {metric}: {slope:+.2f}/h (threshold {threshold}/h)")
+        if slope > threshold:
+            leaks[metric] = slope
+    return leaks
+
+
+def parse_duration(value: str) -> float:
+    """'90' or '90s', '30m', '4h' -> seconds."""
+    units = {"s": 1, "m": 60, "h": 3600}
+    if value[-1] in units:
+        return float(value[:-1]) * units[value[-1]]
+    return float(value)
+
+
+def run_soak(duration_s: float, interval_s: float, output: Path, channel: str, headless: bool,
+             record_network: bool = False):
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with sync_playwright() as playwright, open(output, "w", newline="") as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=CSV_COLUMNS)
+        writer.writeheader()
+
+        browser = playwright.chromium.launch(channel=channel, headless=headless)
+        context = browser.new_context()
+        page = context.new_page()
+        sampler = MetricsSampler(browser, page)
+
+        started = time.monotonic()
+        last_sample = None
+        iteration = 0
+        failed_iterations = 0
+        while time.monotonic() - started < duration_s:
+            recorder = None
+            if record_network:
+                # Exercises the per-test listener and Allure hook registration the fixtures go through
+                recorder = NetworkRecorder(output.parent / "network" / "iteration.jsonl", f"iteration {iteration + 1}")
+                recorder.start(context)
+            try:
+                purchase_journey(page)
+            except Exception as e:
+                # A flaky step must not end a multi-hour run; failures are counted and sampling goes on
+                failed_iterations += 1
+                logger.error(f"Soak iteration {iteration + 1} failed: {(str(e) or repr(e)).splitlines()[0]}")
+                reset_session(page)
+            finally:
+                if recorder:
+                    recorder.stop()
+            iteration += 1
+            now = time.monotonic()
+            if last_sample is None or now - last_sample >= interval_s:
+                row = {"timestamp": time.strftime("%Y-%m-%d %H:%M:%S"), "elapsed_s": round(now - started, 1),
+                       "iteration": iteration, "failed_iterations": failed_iterations, **sampler.sample()}
+                writer.writerow(row)
+                csv_file.flush()
+                logger.info(f"Soak sample #{iteration}: heap {row['js_heap_used_mb']} MB, "
+                            f"nodes {row['dom_nodes']}, listeners {row['js_event_listeners']}")
+                last_sample = now
+
+        context.close()
+        browser.close()
+    logger.info(f"Soak finished: {iteration} iterations ({failed_iterations} failed), samples in {output}")
+
+
+def report_leaks(csv_path: Path) -> int:
+    leaks = detect_leaks(csv_path)
+    for metric, slope in leaks.items():
+        logger.error(f"Possible leak: {metric} grows {slope:+.2f}/h (threshold {LEAK_THRESHOLDS_PER_HOUR[metric]}/h)")
+    return 1 if leaks else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Repeat the e2e purchase journey and watch for memory growth")
+    parser.add_argument("--duration", default="1h", help="How long to run, e.g. 900s, 30m, 4h (default: 1h)")
+    parser.add_argument("--interval", type=float, default=60, help="Seconds between samples (default: 60)")
+    parser.add_argument("--output", type=Path, default=Path("soak-results/soak.csv"))
+    parser.add_argument("--channel", default="chrome", help="Chromium channel (default: chrome)")
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument("--record-network", action="store_true",
+                        help="Attach the network recorder every iteration, as pytest --record-network does per test")
+    parser.add_argument("--analyze", type=Path, metavar="CSV", help="Only analyze an existing samples CSV")
+    args = parser.parse_args(argv)
+
+    if args.analyze:
+        return report_leaks(args.analyze)
+
+    exit_code = 0
+    try:
+        run_soak(parse_duration(args.duration), args.interval, args.output, args.channel, not args.headed,
+                 args.record_network)
+    finally:
+        # Samples taken before a crash or Ctrl+C are still worth a trend
+        if args.output.exists():
+            exit_code = report_leaks(args.output)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))